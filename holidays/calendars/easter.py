@@ -0,0 +1,321 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/python-holidays
+#  License: MIT (see LICENSE file)
+
+from holidays.calendars.gregorian import MAR, APR
+
+# Easter Sunday dates for the Western (Gregorian) computus, pre-calculated
+# with dateutil.easter.easter(year, method=EASTER_WESTERN) for the years the
+# library is commonly queried for. Years outside this range fall back to the
+# Meeus/Butcher algorithm.
+EASTER_WESTERN_DATES = {
+    1900: (APR, 15),
+    1901: (APR, 7),
+    1902: (MAR, 30),
+    1903: (APR, 12),
+    1904: (APR, 3),
+    1905: (APR, 23),
+    1906: (APR, 15),
+    1907: (MAR, 31),
+    1908: (APR, 19),
+    1909: (APR, 11),
+    1910: (MAR, 27),
+    1911: (APR, 16),
+    1912: (APR, 7),
+    1913: (MAR, 23),
+    1914: (APR, 12),
+    1915: (APR, 4),
+    1916: (APR, 23),
+    1917: (APR, 8),
+    1918: (MAR, 31),
+    1919: (APR, 20),
+    1920: (APR, 4),
+    1921: (MAR, 27),
+    1922: (APR, 16),
+    1923: (APR, 1),
+    1924: (APR, 20),
+    1925: (APR, 12),
+    1926: (APR, 4),
+    1927: (APR, 17),
+    1928: (APR, 8),
+    1929: (MAR, 31),
+    1930: (APR, 20),
+    1931: (APR, 5),
+    1932: (MAR, 27),
+    1933: (APR, 16),
+    1934: (APR, 1),
+    1935: (APR, 21),
+    1936: (APR, 12),
+    1937: (MAR, 28),
+    1938: (APR, 17),
+    1939: (APR, 9),
+    1940: (MAR, 24),
+    1941: (APR, 13),
+    1942: (APR, 5),
+    1943: (APR, 25),
+    1944: (APR, 9),
+    1945: (APR, 1),
+    1946: (APR, 21),
+    1947: (APR, 6),
+    1948: (MAR, 28),
+    1949: (APR, 17),
+    1950: (APR, 9),
+    1951: (MAR, 25),
+    1952: (APR, 13),
+    1953: (APR, 5),
+    1954: (APR, 18),
+    1955: (APR, 10),
+    1956: (APR, 1),
+    1957: (APR, 21),
+    1958: (APR, 6),
+    1959: (MAR, 29),
+    1960: (APR, 17),
+    1961: (APR, 2),
+    1962: (APR, 22),
+    1963: (APR, 14),
+    1964: (MAR, 29),
+    1965: (APR, 18),
+    1966: (APR, 10),
+    1967: (MAR, 26),
+    1968: (APR, 14),
+    1969: (APR, 6),
+    1970: (MAR, 29),
+    1971: (APR, 11),
+    1972: (APR, 2),
+    1973: (APR, 22),
+    1974: (APR, 14),
+    1975: (MAR, 30),
+    1976: (APR, 18),
+    1977: (APR, 10),
+    1978: (MAR, 26),
+    1979: (APR, 15),
+    1980: (APR, 6),
+    1981: (APR, 19),
+    1982: (APR, 11),
+    1983: (APR, 3),
+    1984: (APR, 22),
+    1985: (APR, 7),
+    1986: (MAR, 30),
+    1987: (APR, 19),
+    1988: (APR, 3),
+    1989: (MAR, 26),
+    1990: (APR, 15),
+    1991: (MAR, 31),
+    1992: (APR, 19),
+    1993: (APR, 11),
+    1994: (APR, 3),
+    1995: (APR, 16),
+    1996: (APR, 7),
+    1997: (MAR, 30),
+    1998: (APR, 12),
+    1999: (APR, 4),
+    2000: (APR, 23),
+    2001: (APR, 15),
+    2002: (MAR, 31),
+    2003: (APR, 20),
+    2004: (APR, 11),
+    2005: (MAR, 27),
+    2006: (APR, 16),
+    2007: (APR, 8),
+    2008: (MAR, 23),
+    2009: (APR, 12),
+    2010: (APR, 4),
+    2011: (APR, 24),
+    2012: (APR, 8),
+    2013: (MAR, 31),
+    2014: (APR, 20),
+    2015: (APR, 5),
+    2016: (MAR, 27),
+    2017: (APR, 16),
+    2018: (APR, 1),
+    2019: (APR, 21),
+    2020: (APR, 12),
+    2021: (APR, 4),
+    2022: (APR, 17),
+    2023: (APR, 9),
+    2024: (MAR, 31),
+    2025: (APR, 20),
+    2026: (APR, 5),
+    2027: (MAR, 28),
+    2028: (APR, 16),
+    2029: (APR, 1),
+    2030: (APR, 21),
+    2031: (APR, 13),
+    2032: (MAR, 28),
+    2033: (APR, 17),
+    2034: (APR, 9),
+    2035: (MAR, 25),
+    2036: (APR, 13),
+    2037: (APR, 5),
+    2038: (APR, 25),
+    2039: (APR, 10),
+    2040: (APR, 1),
+    2041: (APR, 21),
+    2042: (APR, 6),
+    2043: (MAR, 29),
+    2044: (APR, 17),
+    2045: (APR, 9),
+    2046: (MAR, 25),
+    2047: (APR, 14),
+    2048: (APR, 5),
+    2049: (APR, 18),
+    2050: (APR, 10),
+    2051: (APR, 2),
+    2052: (APR, 21),
+    2053: (APR, 6),
+    2054: (MAR, 29),
+    2055: (APR, 18),
+    2056: (APR, 2),
+    2057: (APR, 22),
+    2058: (APR, 14),
+    2059: (MAR, 30),
+    2060: (APR, 18),
+    2061: (APR, 10),
+    2062: (MAR, 26),
+    2063: (APR, 15),
+    2064: (APR, 6),
+    2065: (MAR, 29),
+    2066: (APR, 11),
+    2067: (APR, 3),
+    2068: (APR, 22),
+    2069: (APR, 14),
+    2070: (MAR, 30),
+    2071: (APR, 19),
+    2072: (APR, 10),
+    2073: (MAR, 26),
+    2074: (APR, 15),
+    2075: (APR, 7),
+    2076: (APR, 19),
+    2077: (APR, 11),
+    2078: (APR, 3),
+    2079: (APR, 23),
+    2080: (APR, 7),
+    2081: (MAR, 30),
+    2082: (APR, 19),
+    2083: (APR, 4),
+    2084: (MAR, 26),
+    2085: (APR, 15),
+    2086: (MAR, 31),
+    2087: (APR, 20),
+    2088: (APR, 11),
+    2089: (APR, 3),
+    2090: (APR, 16),
+    2091: (APR, 8),
+    2092: (MAR, 30),
+    2093: (APR, 12),
+    2094: (APR, 4),
+    2095: (APR, 24),
+    2096: (APR, 15),
+    2097: (MAR, 31),
+    2098: (APR, 20),
+    2099: (APR, 12),
+    2100: (MAR, 28),
+    2101: (APR, 17),
+    2102: (APR, 9),
+    2103: (MAR, 25),
+    2104: (APR, 13),
+    2105: (APR, 5),
+    2106: (APR, 18),
+    2107: (APR, 10),
+    2108: (APR, 1),
+    2109: (APR, 21),
+    2110: (APR, 6),
+    2111: (MAR, 29),
+    2112: (APR, 17),
+    2113: (APR, 2),
+    2114: (APR, 22),
+    2115: (APR, 14),
+    2116: (MAR, 29),
+    2117: (APR, 18),
+    2118: (APR, 10),
+    2119: (MAR, 26),
+    2120: (APR, 14),
+    2121: (APR, 6),
+    2122: (MAR, 29),
+    2123: (APR, 11),
+    2124: (APR, 2),
+    2125: (APR, 22),
+    2126: (APR, 14),
+    2127: (MAR, 30),
+    2128: (APR, 18),
+    2129: (APR, 10),
+    2130: (MAR, 26),
+    2131: (APR, 15),
+    2132: (APR, 6),
+    2133: (APR, 19),
+    2134: (APR, 11),
+    2135: (APR, 3),
+    2136: (APR, 22),
+    2137: (APR, 7),
+    2138: (MAR, 30),
+    2139: (APR, 19),
+    2140: (APR, 3),
+    2141: (MAR, 26),
+    2142: (APR, 15),
+    2143: (MAR, 31),
+    2144: (APR, 19),
+    2145: (APR, 11),
+    2146: (APR, 3),
+    2147: (APR, 16),
+    2148: (APR, 7),
+    2149: (MAR, 30),
+    2150: (APR, 12),
+    2151: (APR, 4),
+    2152: (APR, 23),
+    2153: (APR, 15),
+    2154: (MAR, 31),
+    2155: (APR, 20),
+    2156: (APR, 11),
+    2157: (MAR, 27),
+    2158: (APR, 16),
+    2159: (APR, 8),
+    2160: (MAR, 23),
+    2161: (APR, 12),
+    2162: (APR, 4),
+    2163: (APR, 24),
+    2164: (APR, 8),
+    2165: (MAR, 31),
+    2166: (APR, 20),
+    2167: (APR, 5),
+    2168: (MAR, 27),
+    2169: (APR, 16),
+    2170: (APR, 1),
+    2171: (APR, 21),
+    2172: (APR, 12),
+    2173: (APR, 4),
+    2174: (APR, 17),
+    2175: (APR, 9),
+    2176: (MAR, 31),
+    2177: (APR, 20),
+    2178: (APR, 5),
+    2179: (MAR, 28),
+    2180: (APR, 16),
+    2181: (APR, 1),
+    2182: (APR, 21),
+    2183: (APR, 13),
+    2184: (MAR, 28),
+    2185: (APR, 17),
+    2186: (APR, 9),
+    2187: (MAR, 25),
+    2188: (APR, 13),
+    2189: (APR, 5),
+    2190: (APR, 25),
+    2191: (APR, 10),
+    2192: (APR, 1),
+    2193: (APR, 21),
+    2194: (APR, 6),
+    2195: (MAR, 29),
+    2196: (APR, 17),
+    2197: (APR, 9),
+    2198: (MAR, 25),
+    2199: (APR, 14),
+    2200: (APR, 6),
+}
@@ -23,6 +23,9 @@ class IsleOfMan(UnitedKingdom):
 
     country = "IM"
     subdivisions = ()  # Override UnitedKingdom subdivisions.
+    # The Easter-based holidays apply to all years; the United Kingdom
+    # 1871 threshold only gates the holidays shared with it.
+    _start_year = 1
 
     def __init__(self, *args, **kwargs):  # Override UnitedKingdom __init__().
         ChristianHolidays.__init__(self)
@@ -10,7 +10,8 @@
 #  Website: https://github.com/vacanza/python-holidays
 #  License: MIT (see LICENSE file)
 
-from typing import Tuple, Union
+from datetime import date
+from typing import Dict, Tuple, Union
 
 from holidays.calendars.gregorian import APR, MAY, JUN, JUL, SEP, DEC
 from holidays.groups import ChristianHolidays, InternationalHolidays, StaticHolidays
@@ -21,6 +22,19 @@ from holidays.observed_holiday_base import (
     SAT_SUN_TO_NEXT_MON_TUE,
 )
 
+# Years the May Day bank holiday was moved to May 8 (VE Day anniversaries).
+MAY_DAY_DATES = {
+    1995: (MAY, 8),
+    2020: (MAY, 8),
+}
+
+# Years the Spring bank holiday was moved for royal jubilees.
+SPRING_BANK_DATES = {
+    2002: (JUN, 4),
+    2012: (JUN, 4),
+    2022: (JUN, 2),
+}
+
 
 class UnitedKingdom(ObservedHolidayBase, ChristianHolidays, InternationalHolidays, StaticHolidays):
     """
@@ -53,6 +67,14 @@ class UnitedKingdom(ObservedHolidayBase, ChristianHolidays, InternationalHoliday
         "Wales",
     )
 
+    # Populated years cached across instances, keyed by the settings that
+    # affect the calculation outcome. The cache grows unbounded, but stays
+    # small in practice: one entry per (settings, year) combination in use.
+    _populate_cache: Dict[tuple, Tuple[Tuple[date, str], ...]] = {}
+
+    # Bank Holidays Act 1871
+    _start_year = 1872
+
     def __init__(self, *args, **kwargs):
         ChristianHolidays.__init__(self)
         InternationalHolidays.__init__(self)
@@ -62,6 +84,33 @@ class UnitedKingdom(ObservedHolidayBase, ChristianHolidays, InternationalHoliday
         kwargs.setdefault("observed_since", 1875)
         super().__init__(*args, **kwargs)
 
+    def _populate(self, year: int) -> None:
+        if year < self._start_year:
+            self._year = year
+            return None
+
+        key = (
+            type(self),
+            year,
+            self.subdiv,
+            self.observed,
+            tuple(sorted(self._observed_rule.items())),
+            self._observed_since,
+            self.language,
+            tuple(self._sorted_categories),
+        )
+        if (cached := self._populate_cache.get(key)) is not None:
+            self._year = year
+            for dt, name in cached:
+                self[dt] = name
+            return None
+
+        existing_dts = set(self.keys())
+        super()._populate(year)
+        self._populate_cache[key] = tuple(
+            (dt, name) for dt, name in self.items() if dt not in existing_dts
+        )
+
     def _populate_public_holidays(self) -> None:
         # Bank Holidays Act 1871
         if self._year <= 1871:
@@ -73,33 +122,19 @@ class UnitedKingdom(ObservedHolidayBase, ChristianHolidays, InternationalHoliday
         # May Day bank holiday (first Monday in May)
         if self._year >= 1978:
             name = "May Day"
-            if self._year in {1995, 2020}:
-                self._add_holiday_may_8(name)
+            if dts := MAY_DAY_DATES.get(self._year):
+                self._add_holiday(name, dts)
             else:
                 self._add_holiday_1st_mon_of_may(name)
 
         # Spring bank holiday (last Monday in May)
         if self._year >= 1971:
-            spring_bank_dates = {
-                2002: (JUN, 4),
-                2012: (JUN, 4),
-                2022: (JUN, 2),
-            }
             name = "Spring Bank Holiday"
-            if self._year in spring_bank_dates:
-                self._add_holiday(name, spring_bank_dates[self._year])
+            if dts := SPRING_BANK_DATES.get(self._year):
+                self._add_holiday(name, dts)
             else:
                 self._add_holiday_last_mon_of_may(name)
 
-        if self.subdiv == "England":
-            self._populate_subdiv_eng_public_holidays()
-        elif self.subdiv == "Northern Ireland":
-            self._populate_subdiv_nir_public_holidays()
-        elif self.subdiv == "Scotland":
-            self._populate_subdiv_sct_public_holidays()
-        elif self.subdiv == "Wales":
-            self._populate_subdiv_wls_public_holidays()
-
     def _populate_subdiv_holidays(self):
         # Bank Holidays Act 1871
         if self._year <= 1871:
@@ -195,6 +230,13 @@ class UnitedKingdom(ObservedHolidayBase, ChristianHolidays, InternationalHoliday
         if self._year >= 1971:
             self._add_holiday_last_mon_of_aug("Late Summer Bank Holiday")
 
+    # Deprecated subdivision names dispatch through the standard subdivision
+    # machinery, so no per-year name checks are needed.
+    _populate_subdiv_england_public_holidays = _populate_subdiv_eng_public_holidays
+    _populate_subdiv_northern_ireland_public_holidays = _populate_subdiv_nir_public_holidays
+    _populate_subdiv_scotland_public_holidays = _populate_subdiv_sct_public_holidays
+    _populate_subdiv_wales_public_holidays = _populate_subdiv_wls_public_holidays
+
 
 class UK(UnitedKingdom):
     pass
@@ -12,14 +12,31 @@
 
 from datetime import date
 from datetime import timedelta as td
+from functools import lru_cache
+from typing import Literal
 
 from dateutil.easter import EASTER_ORTHODOX, EASTER_WESTERN, easter
 
+from holidays.calendars.easter import EASTER_WESTERN_DATES
 from holidays.calendars.gregorian import GREGORIAN_CALENDAR, JAN, DEC
 from holidays.calendars.julian import JULIAN_CALENDAR
 from holidays.calendars.julian_revised import JULIAN_REVISED_CALENDAR
 
 
+@lru_cache()
+def _get_easter_sunday_date(year: int, method: Literal[1, 2, 3]) -> date:
+    """
+    Calculate Easter Sunday date for a given year and method.
+
+    Western dates are served from the pre-calculated table where available.
+    The result is cached as entities calculate the same Easter Sunday date
+    multiple times per populated year.
+    """
+    if method == EASTER_WESTERN and (month_day := EASTER_WESTERN_DATES.get(year)):
+        return date(year, *month_day)
+    return easter(year, method=method)
+
+
 class ChristianHolidays:
     """
     Christian holidays.
@@ -49,9 +66,9 @@ class ChristianHolidays:
         calendar = calendar or self.__calendar
         self.__verify_calendar(calendar)
 
-        return easter(
+        return _get_easter_sunday_date(
             self._year,
-            method=EASTER_WESTERN if self.__is_gregorian_calendar(calendar) else EASTER_ORTHODOX,
+            EASTER_WESTERN if self.__is_gregorian_calendar(calendar) else EASTER_ORTHODOX,
         )
 
     @staticmethod
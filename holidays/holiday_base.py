@@ -17,8 +17,8 @@ import re
 import warnings
 from calendar import isleap
 from datetime import date, datetime, timedelta, timezone
-from functools import cached_property
-from gettext import gettext, translation
+from functools import cached_property, lru_cache
+from gettext import NullTranslations, gettext, translation
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union, cast
 
@@ -50,6 +50,23 @@ SubstitutedHoliday = Union[
 YearArg = Union[int, Iterable[int]]
 
 
+@lru_cache()
+def _get_translation(entity_code: str, language: str) -> NullTranslations:
+    """
+    Return the translations for an entity and an explicitly requested
+    supported language.
+
+    The lookup walks the locale directory, so it is shared between instances
+    with identical settings. Fallback lookups honor the runtime language
+    environment variables and must not be cached.
+    """
+    return translation(
+        entity_code,
+        languages=[language],
+        localedir=str(Path(__file__).with_name("locale")),
+    )
+
+
 class HolidayBase(Dict[date, str]):
     """
     A dict-like object containing the holidays for a specific country (and
@@ -355,16 +372,16 @@ class HolidayBase(Dict[date, str]):
         self.subdiv = subdiv
 
         supported_languages = set(self.supported_languages)
-        self.tr = (
-            translation(
+        if self._entity_code is None:
+            self.tr = gettext
+        elif language in supported_languages:
+            self.tr = _get_translation(self._entity_code, language).gettext
+        else:
+            self.tr = translation(
                 self._entity_code,
-                fallback=language not in supported_languages,
-                languages=[language] if language in supported_languages else None,
+                fallback=True,
                 localedir=str(Path(__file__).with_name("locale")),
             ).gettext
-            if self._entity_code is not None
-            else gettext
-        )
         self.years = _normalize_arguments(int, years)
 
         # Populate holidays.
@@ -431,40 +448,43 @@ class HolidayBase(Dict[date, str]):
             if name[: len(add_holiday_prefix)] != add_holiday_prefix:
                 raise e
 
+            # The pattern constants are parsed once and the generated method is
+            # cached on the class, so repeated calls skip the regex matching
+            # and helper construction entirely.
+            method = None
+
             # Handle <month> <day> patterns (e.g., _add_holiday_jun_15()).
             month_day = re.match(r"_add_holiday_(\w{3})_(\d{1,2})", name)
             if month_day:
                 month, day = month_day.groups()
-                return lambda name: self._add_holiday(
-                    name,
-                    date(self._year, getattr(gregorian, month.upper()), int(day)),
-                )
+                month = getattr(gregorian, month.upper())
+                day = int(day)
+
+                def method(self, name):
+                    return self._add_holiday(name, date(self._year, month, day))
 
             # Handle <last/nth> <weekday> of <month> patterns (e.g.,
             # _add_holiday_last_mon_of_aug() or _add_holiday_3rd_fri_of_aug()).
-            nth_weekday_of_month = re.match(
+            elif nth_weekday_of_month := re.match(
                 r"_add_holiday_(last|\d\w{2})_(\w{3})_of_(\w{3})", name
-            )
-            if nth_weekday_of_month:
+            ):
                 number, weekday, month = nth_weekday_of_month.groups()
-                return lambda name: self._add_holiday(
-                    name,
-                    _get_nth_weekday_of_month(
-                        -1 if number == "last" else +int(re.sub(r"\D", "", number)),
-                        getattr(gregorian, weekday.upper()),
-                        getattr(gregorian, month.upper()),
-                        self._year,
-                    ),
-                )
+                number = -1 if number == "last" else +int(re.sub(r"\D", "", number))
+                weekday = getattr(gregorian, weekday.upper())
+                month = getattr(gregorian, month.upper())
+
+                def method(self, name):
+                    return self._add_holiday(
+                        name, _get_nth_weekday_of_month(number, weekday, month, self._year)
+                    )
 
             # Handle <n> day(s) <past/prior> <last/<nth> <weekday> of <month> patterns (e.g.,
             # _add_holiday_1_day_past_1st_fri_of_aug() or
             # _add_holiday_5_days_prior_last_fri_of_aug()).
-            nth_weekday_of_month_with_delta = re.match(
+            elif nth_weekday_of_month_with_delta := re.match(
                 r"_add_holiday_(\d{1,2})_days?_(past|prior)_(last|\d\w{2})_(\w{3})_of_(\w{3})",
                 name,
-            )
-            if nth_weekday_of_month_with_delta:
+            ):
                 (
                     days,
                     delta_direction,
@@ -472,34 +492,38 @@ class HolidayBase(Dict[date, str]):
                     weekday,
                     month,
                 ) = nth_weekday_of_month_with_delta.groups()
-                return lambda name: self._add_holiday(
-                    name,
-                    _get_nth_weekday_of_month(
-                        -1 if number == "last" else +int(re.sub(r"\D", "", number)),
-                        getattr(gregorian, weekday.upper()),
-                        getattr(gregorian, month.upper()),
-                        self._year,
+                number = -1 if number == "last" else +int(re.sub(r"\D", "", number))
+                weekday = getattr(gregorian, weekday.upper())
+                month = getattr(gregorian, month.upper())
+                delta = timedelta(days=+int(days) if delta_direction == "past" else -int(days))
+
+                def method(self, name):
+                    return self._add_holiday(
+                        name,
+                        _get_nth_weekday_of_month(number, weekday, month, self._year) + delta,
                     )
-                    + timedelta(days=+int(days) if delta_direction == "past" else -int(days)),
-                )
 
             # Handle <nth> <weekday> <before/from> <month> <day> patterns (e.g.,
             # _add_holiday_1st_mon_before_jun_15() or _add_holiday_1st_mon_from_jun_15()).
-            nth_weekday_from = re.match(
+            elif nth_weekday_from := re.match(
                 r"_add_holiday_(\d{1,2})\w{2}_(\w+)_(before|from)_(\w{3})_(\d{1,2})", name
-            )
-            if nth_weekday_from:
+            ):
                 number, weekday, date_direction, month, day = nth_weekday_from.groups()
-                return lambda name: self._add_holiday(
-                    name,
-                    _get_nth_weekday_from(
-                        -int(number) if date_direction == "before" else +int(number),
-                        getattr(gregorian, weekday.upper()),
-                        date(self._year, getattr(gregorian, month.upper()), int(day)),
-                    ),
-                )
+                number = -int(number) if date_direction == "before" else +int(number)
+                weekday = getattr(gregorian, weekday.upper())
+                month = getattr(gregorian, month.upper())
+                day = int(day)
+
+                def method(self, name):
+                    return self._add_holiday(
+                        name, _get_nth_weekday_from(number, weekday, date(self._year, month, day))
+                    )
+
+            if method is None:
+                raise e  # No match.
 
-            raise e  # No match.
+            setattr(self.__class__, name, method)
+            return getattr(self, name)
 
     def __getitem__(self, key: DateLike) -> Any:
         if isinstance(key, slice):
@@ -625,14 +649,16 @@ class HolidayBase(Dict[date, str]):
                 self._populate(year)
 
     def __setitem__(self, key: DateLike, value: str) -> None:
-        if key in self:
+        dt = self.__keytransform__(key)
+
+        if dict.__contains__(cast("Dict[Any, Any]", self), dt):
             # If there are multiple holidays on the same date
             # order their names alphabetically.
-            holiday_names = set(self[key].split(HOLIDAY_NAME_DELIMITER))
+            holiday_names = set(dict.__getitem__(self, dt).split(HOLIDAY_NAME_DELIMITER))
             holiday_names.add(value)
             value = HOLIDAY_NAME_DELIMITER.join(sorted(holiday_names))
 
-        dict.__setitem__(self, self.__keytransform__(key), value)
+        dict.__setitem__(self, dt, value)
 
     def __str__(self) -> str:
         if self:
@@ -680,6 +706,46 @@ class HolidayBase(Dict[date, str]):
     def _sorted_categories(self):
         return sorted(self.categories)
 
+    @cached_property
+    def _populate_common_method_names(self) -> Tuple[str, ...]:
+        """Existing per-category common holidays populate method names."""
+        return tuple(
+            method_name
+            for category in self._sorted_categories
+            if getattr(self, (method_name := f"_populate_{category.lower()}_holidays"), None)
+        )
+
+    @cached_property
+    def _populate_subdiv_method_names(self) -> Tuple[str, ...]:
+        """Existing per-category subdivision holidays populate method names."""
+        return tuple(
+            method_name
+            for category in self._sorted_categories
+            if getattr(
+                self,
+                (
+                    method_name := (
+                        f"_populate_subdiv_{self._normalized_subdiv}_"
+                        f"{category.lower()}_holidays"
+                    )
+                ),
+                None,
+            )
+        )
+
+    @cached_property
+    def _special_common_mapping_names(self) -> Tuple[str, ...]:
+        """Country-wide special holidays mapping names."""
+        return tuple(f"special_{category}_holidays" for category in self._sorted_categories)
+
+    @cached_property
+    def _special_subdiv_mapping_names(self) -> Tuple[str, ...]:
+        """Subdivision special holidays mapping names."""
+        return tuple(
+            f"special_{self._normalized_subdiv}_{category.lower()}_holidays"
+            for category in self._sorted_categories
+        )
+
     @classmethod
     def get_subdivision_aliases(cls) -> Dict[str, List]:
         """Get subdivision aliases."""
@@ -795,33 +861,22 @@ class HolidayBase(Dict[date, str]):
 
     def _populate_common_holidays(self):
         """Populate entity common holidays."""
-        for category in self._sorted_categories:
-            if pch_method := getattr(self, f"_populate_{category.lower()}_holidays", None):
-                pch_method()
+        for method_name in self._populate_common_method_names:
+            getattr(self, method_name)()
 
         if self.has_special_holidays:
-            self._add_special_holidays(
-                f"special_{category}_holidays" for category in self._sorted_categories
-            )
+            self._add_special_holidays(self._special_common_mapping_names)
 
     def _populate_subdiv_holidays(self):
         """Populate entity subdivision holidays."""
         if self.subdiv is None:
             return None
 
-        for category in self._sorted_categories:
-            if asch_method := getattr(
-                self,
-                f"_populate_subdiv_{self._normalized_subdiv}_{category.lower()}_holidays",
-                None,
-            ):
-                asch_method()
+        for method_name in self._populate_subdiv_method_names:
+            getattr(self, method_name)()
 
         if self.has_special_holidays:
-            self._add_special_holidays(
-                f"special_{self._normalized_subdiv}_{category.lower()}_holidays"
-                for category in self._sorted_categories
-            )
+            self._add_special_holidays(self._special_subdiv_mapping_names)
 
     def append(self, *args: Union[Dict[DateLike, str], List[DateLike], DateLike]) -> None:
         """Alias for :meth:`update` to mimic list type."""
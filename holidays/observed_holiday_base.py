@@ -12,6 +12,7 @@
 
 from datetime import date
 from datetime import timedelta as td
+from functools import cached_property
 from typing import Dict, Optional, Tuple, Set
 
 from holidays.calendars.gregorian import MON, TUE, WED, THU, FRI, SAT, SUN
@@ -105,6 +106,22 @@ class ObservedHolidayBase(HolidayBase):
     def _is_observed(self, *args, **kwargs) -> bool:
         return self._observed_since is None or self._year >= self._observed_since
 
+    @cached_property
+    def _translated_estimated_label(self) -> str:
+        return self.tr(getattr(self, "estimated_label", ""))
+
+    @cached_property
+    def _estimated_label_text(self) -> str:
+        return self._translated_estimated_label.strip("%s ()")
+
+    @cached_property
+    def _translated_observed_label(self) -> str:
+        return self.tr(self.observed_label)
+
+    @cached_property
+    def _translated_observed_label_before(self) -> str:
+        return self.tr(getattr(self, "observed_label_before", self.observed_label))
+
     def _get_next_workday(self, dt: date, delta: int = +1) -> date:
         dt_work = dt + td(days=delta)
         while dt_work.year == self._year:
@@ -135,16 +152,13 @@ class ObservedHolidayBase(HolidayBase):
         if dt_observed == dt:
             return False, dt
 
-        estimated_label = self.tr(getattr(self, "estimated_label", ""))
-        observed_label = self.tr(
-            getattr(
-                self,
-                "observed_label_before" if dt_observed < dt else "observed_label",
-                self.observed_label,
-            )
+        observed_label = (
+            self._translated_observed_label_before
+            if dt_observed < dt
+            else self._translated_observed_label
         )
 
-        estimated_label_text = estimated_label.strip("%s ()")
+        estimated_label_text = self._estimated_label_text
         # Use observed_estimated_label instead of observed_label for estimated dates.
         for name in (name,) if name else self.get_list(dt):
             holiday_name = self.tr(name)
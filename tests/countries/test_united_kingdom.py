@@ -14,6 +14,7 @@ import warnings
 from unittest import TestCase
 
 from holidays.countries.united_kingdom import UnitedKingdom, UK, GB, GBR
+from holidays.observed_holiday_base import SAT_SUN_TO_NEXT_MON_TUE
 from tests.common import CommonCountryTests
 
 
@@ -466,5 +467,27 @@ class TestUnitedKingdom(CommonCountryTests, TestCase):
         }
         self.assertEqual(all_holidays, y_2015)
 
+    def test_populate_cache(self):
+        UnitedKingdom._populate_cache.clear()
+
+        # A second identically-configured instance replays the cached year.
+        default = UnitedKingdom(years=1995)
+        replayed = UnitedKingdom(years=1995)
+        self.assertEqual(sorted(default.items()), sorted(replayed.items()))
+
+        # Instances whose settings change the outcome must not share
+        # previously cached results.
+        self.assertHoliday(default, "1995-01-02")
+        self.assertNotIn("1995-01-02", UnitedKingdom(years=1995, observed=False))
+        self.assertNoHoliday(UnitedKingdom(years=1995, observed_since=2000), "1995-01-02")
+        self.assertHoliday(
+            UnitedKingdom(years=1995, observed_rule=SAT_SUN_TO_NEXT_MON_TUE), "1995-01-03"
+        )
+        self.assertNoHoliday(default, "1995-08-07")
+        self.assertHoliday(UnitedKingdom(years=1995, subdiv="SCT"), "1995-08-07")
+        self.assertEqual(
+            sorted(default.items()), sorted(UnitedKingdom(years=1995, language="en_US").items())
+        )
+
     def test_subdiv_deprecation(self):
         self.assertDeprecatedSubdivisions("This subdivision is deprecated and will be removed")